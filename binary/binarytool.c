@@ -92,3 +92,31 @@ void createBinaryCnode(char*fname, char* name, char* type, char* uuid, char* des
 }
 
 
+
+typedef struct {
+    char* name;
+    char* type;
+    char* uuid;
+    char* descr;
+    char* datatype;
+    char* min;
+    char* max;
+    char* unit;
+    char* allowed;
+    char* defaultAllowed;
+    char* validate;
+    int children;
+} BinaryNode;
+
+void createBinaryCnodeBatch(char* fname, BinaryNode* nodes, int nodeCount) {
+    treeFp = fopen(fname, "a");
+    if (treeFp == NULL) {
+        printf("Could not open file=%s for writing of tree.\n", fname);
+        return;
+    }
+    for (int i = 0; i < nodeCount; i++) {
+        BinaryNode* node = &nodes[i];
+        writeNodeData(node->name, node->type, node->uuid, node->descr, node->datatype, node->min, node->max, node->unit, node->allowed, node->defaultAllowed, node->validate, node->children);
+    }
+    fclose(treeFp);
+}
@@ -107,6 +107,15 @@ class TestConstantsNode(unittest.TestCase):
     def test_invalid_vss_data_types(self):
         with self.assertRaises(Exception): VSSDataType.from_str("not_a_valid_case")
 
+    def test_encoded_values(self):
+        """
+        Test utf-8 encoded values are available on constants
+        """
+
+        self.assertEqual(b"sensor", VSSType.SENSOR.b_value)
+        self.assertEqual(b"int8[]", VSSDataType.INT8_ARRAY.b_value)
+        self.assertEqual(b"km/h", Unit.KILOMETERPERHOUR.b_value)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -12,10 +12,11 @@
 #
 # noinspection PyPackageRequirements
 import re
+from functools import lru_cache
 from enum import Enum, EnumMeta
 import pkg_resources
 from typing import (
-    Sequence, Type, TypeVar, Optional, Dict, Tuple, Iterator,
+    KeysView, Type, TypeVar, Optional, Dict, Tuple, Iterator,
 )
 
 import yaml
@@ -23,6 +24,9 @@ import yaml
 
 NON_ALPHANUMERIC_WORD = re.compile('[^A-Za-z0-9]+')
 
+# Prefer the libyaml-backed loader, which is much faster than the pure Python one
+YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
 T = TypeVar("T")
 
 
@@ -31,12 +35,14 @@ class VSSConstant(str):
     """
     label: str
     value: str
+    b_value: bytes
     description: Optional[str] = None
     domain: Optional[str] = None
 
     def __new__(cls, label: str, value: str, description: str = "", domain: str = "") -> 'VSSConstant':
         self = super().__new__(cls, value)
         self.label = label
+        self.b_value = value.encode('utf-8')
         self.description = description
         self.domain = domain
         return self
@@ -46,9 +52,13 @@ class VSSConstant(str):
         return self
 
 
+@lru_cache(maxsize=None)
+def label_to_constant_name(label: str) -> str:
+    return NON_ALPHANUMERIC_WORD.sub('', label).upper()
+
+
 def dict_to_constant_config(name: str, info: Dict[str, str]) -> Tuple[str, VSSConstant]:
-    label = info['label']
-    label = NON_ALPHANUMERIC_WORD.sub('', label).upper()
+    label = label_to_constant_name(info['label'])
     description = info.get('description', None)
     domain = info.get('domain', None)
     return label, VSSConstant(info['label'], name, description, domain)
@@ -59,11 +69,23 @@ def iterate_config_members(config: Dict[str, Dict[str, str]]) -> Iterator[Tuple[
         yield dict_to_constant_config(u, v)
 
 
-def get_members_from_default_config(key: str) -> Dict[str, VSSConstant]:
+@lru_cache(maxsize=None)
+def load_default_config() -> Dict[str, Dict[str, Dict[str, str]]]:
+    """Parses the bundled config.yaml once and shares the result.
+    Callers must not mutate the returned dictionary.
+    """
     with pkg_resources.resource_stream('vspec', 'config.yaml') as config_file:
-        yaml_config = yaml.safe_load(config_file)
-    configs = yaml_config.get(key, {})
-    return dict(iterate_config_members(configs))
+        return yaml.load(config_file, Loader=YAML_LOADER)
+
+
+@lru_cache(maxsize=None)
+def get_default_config_members(key: str) -> Tuple[Tuple[str, VSSConstant], ...]:
+    configs = load_default_config().get(key, {})
+    return tuple(iterate_config_members(configs))
+
+
+def get_members_from_default_config(key: str) -> Dict[str, VSSConstant]:
+    return dict(get_default_config_members(key))
 
 
 class VSSRepositoryMeta(type):
@@ -71,7 +93,7 @@ class VSSRepositoryMeta(type):
      - Access through Class.ATTRIBUTE
      - Class.add_config(Dict[str, Dict[str, str]]): Adds values from file
      - from_str(str): reverse lookup
-     - values(): sequence of values
+     - values(): view of values
     """
 
     def __new__(mcs, cls, bases, classdict):
@@ -81,8 +103,6 @@ class VSSRepositoryMeta(type):
             cls.__reverse_lookup__ = {
                 v.value: v for v in cls.__members__.values()
             }
-        if not hasattr(cls, '__values__'):
-            cls.__values__ = list(cls.__reverse_lookup__.keys())
 
         return cls
 
@@ -95,39 +115,41 @@ class VSSRepositoryMeta(type):
             ) from e
 
     def add_config(cls, config: Dict[str, Dict[str, str]]):
+        members = cls.__members__
+        reverse_lookup = cls.__reverse_lookup__
         for k, v in iterate_config_members(config):
-            if v.value not in cls.__reverse_lookup__ and k not in cls.__members__:
-                cls.__members__[k] = v
-                cls.__reverse_lookup__[v.value] = v
-                cls.__values__.append(v.value)
+            if v.value not in reverse_lookup and k not in members:
+                members[k] = v
+                reverse_lookup[v.value] = v
 
     def from_str(cls: Type[T], value: str) -> T:
         return cls.__reverse_lookup__[value]
 
-    def values(cls: Type[T]) -> Sequence[str]:
-        return cls.__values__
+    def values(cls: Type[T]) -> KeysView[str]:
+        return cls.__reverse_lookup__.keys()
 
 
 class EnumMetaWithReverseLookup(EnumMeta):
     """This class extends EnumMeta and adds:
      - from_str(str): reverse lookup
-     - values(): sequence of values
+     - values(): view of values
+     - member.b_value: utf-8 encoded value
     """
     def __new__(typ, *args, **kwargs):
         cls = super().__new__(typ, *args, **kwargs)
+        for member in cls.__members__.values():
+            member.b_value = member.value.encode('utf-8')
         if not hasattr(cls, "__reverse_lookup__"):
             cls.__reverse_lookup__ = {
                 v.value: v for v in cls.__members__.values()
             }
-        if not hasattr(cls, "__values__"):
-            cls.__values__ = tuple(v.value for v in cls.__members__.values())
         return cls
 
     def from_str(cls: Type[T], value: str) -> T:
         return cls.__reverse_lookup__[value]
 
-    def values(cls: Type[T]) -> Sequence[str]:
-        return cls.__values__
+    def values(cls: Type[T]) -> KeysView[str]:
+        return cls.__reverse_lookup__.keys()
 
 
 class StringStyle(Enum, metaclass=EnumMetaWithReverseLookup):
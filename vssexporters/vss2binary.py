@@ -11,131 +11,105 @@
 import argparse
 import ctypes
 import os.path
+import sys
 from vspec.model.vsstree import VSSNode, VSSType
 
 out_file=""
-_cbinary=None
-
-def createBinaryCnode(fname, nodename, nodetype, uuid, description, nodedatatype, nodemin, nodemax, unit, allowed, defaultAllowed, validate, children):
-    global _cbinary
-    _cbinary.createBinaryCnode(fname, nodename, nodetype, uuid, description, nodedatatype, nodemin, nodemax, unit, allowed, defaultAllowed, validate, children)
+# node types that carry a datatype
+_DATATYPE_BEARING = frozenset((VSSType.SENSOR, VSSType.ACTUATOR, VSSType.ATTRIBUTE))
+
+class BinaryNode(ctypes.Structure):
+    """Mirrors the BinaryNode struct in binarytool.c"""
+    _fields_ = [
+        ("name", ctypes.c_char_p),
+        ("type", ctypes.c_char_p),
+        ("uuid", ctypes.c_char_p),
+        ("descr", ctypes.c_char_p),
+        ("datatype", ctypes.c_char_p),
+        ("min", ctypes.c_char_p),
+        ("max", ctypes.c_char_p),
+        ("unit", ctypes.c_char_p),
+        ("allowed", ctypes.c_char_p),
+        ("defaultAllowed", ctypes.c_char_p),
+        ("validate", ctypes.c_char_p),
+        ("children", ctypes.c_int),
+    ]
+
+_dllAbsPath = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "binary", "binarytool.so")
+try:
+    _cbinary = ctypes.CDLL(_dllAbsPath)
+    #void createBinaryCnodeBatch(char* fname, BinaryNode* nodes, int nodeCount);
+    # CDLL releases the GIL for the duration of the call
+    _cbinary.createBinaryCnodeBatch.argtypes = (ctypes.c_char_p,ctypes.POINTER(BinaryNode),ctypes.c_int)
+    _cbinary.createBinaryCnodeBatch.restype = None
+except (OSError, AttributeError):
+    # missing or outdated library, only needed when exporting to binary
+    _cbinary = None
+
+def createBinaryCnodeBatch(fname, records):
+    nodes = (BinaryNode * len(records))(*records)
+    _cbinary.createBinaryCnodeBatch(fname, nodes, len(records))
 
 def allowedString(allowedList):
-    allowedStr = ""
-    for elem in allowedList:
-        allowedStr += hexAllowedLen(elem) + elem
-#    print("allowedstr=" + allowedStr + "\n")
-    return allowedStr
-
-def hexAllowedLen(allowed):
-    hexDigit1 = len(allowed) // 16
-    hexDigit2 = len(allowed) - hexDigit1*16
-#    print("Hexdigs:" + str(hexDigit1) + str(hexDigit2))
-    return "".join([intToHexChar(hexDigit1), intToHexChar(hexDigit2)])
-
-def intToHexChar(hexInt):
-    if (hexInt < 10):
-        return chr(hexInt + ord('0'))
-    else:
-        return chr(hexInt - 10 + ord('A'))
+    """Returns the utf-8 encoded allowed list, each element prefixed by its length as two hex digits"""
+    return "".join(f"{len(elem):02X}{elem}" for elem in allowedList).encode('utf-8')
 
 def add_arguments(parser: argparse.ArgumentParser):
     parser.description="The binary exporter does not support any additional arguments."
 
 
-def export_node(node, generate_uuid, out_file):
-    nodename = str(node.name)
-    b_nodename = nodename.encode('utf-8')
-
-    nodetype = str(node.type.value)
-    b_nodetype = nodetype.encode('utf-8')
-
-    nodedescription = node.description
-    b_nodedescription = nodedescription.encode('utf-8')
-
-    children = len(node.children)
-
-    nodedatatype = ""
-    nodemin = ""
-    nodemax = ""
-    nodeunit = ""
-    nodeallowed = ""
-    nodedefault = ""
-    nodecomment = ""
-    nodeuuid = ""
-    # not exported to binary
-    nodedeprecation = ""
-    nodeaggregate = ""
-    nodevalidate = ""
-
-    if node.type == VSSType.SENSOR or node.type == VSSType.ACTUATOR or node.type == VSSType.ATTRIBUTE:
-        nodedatatype = str(node.data_type.value)
-    b_nodedatatype = nodedatatype.encode('utf-8')
-
+def node_record(node, generate_uuid):
+    """Returns the utf-8 encoded fields of a node in BinaryNode field order.
+    Comment, deprecation and aggregate are not exported to binary.
+    """
     # many optional attributes are initilized to "" in vsstree.py
-    if node.min != "":
-        nodemin = str(node.min)
-    b_nodemin = nodemin.encode('utf-8')
-
-    if node.max != "":
-        nodemax = str(node.max)
-    b_nodemax = nodemax.encode('utf-8')
-
-    if node.allowed != "":
-        nodeallowed = allowedString(node.allowed)
-    b_nodeallowed = nodeallowed.encode('utf-8')
-
-    if node.default_value != "":
-        nodedefault = str(node.default_value)
-    b_nodedefault = nodedefault.encode('utf-8')
-
-    if node.deprecation != "":
-        nodedeprecation = node.deprecation
-    b_nodedeprecation = nodedeprecation.encode('utf-8')
-
-    # in case of unit or aggregate, the attribute will be missing
-    try:
-        nodeunit = str(node.unit.value)
-    except AttributeError:
-        pass
-    b_nodeunit = nodeunit.encode('utf-8')
-
-    try:
-        nodeaggregate = node.aggregate
-    except AttributeError:
-        pass
-    b_nodeaggregate = nodeaggregate.encode('utf-8')
-
-    if node.comment != "":
-        nodecomment = node.comment
-    b_nodecomment = nodecomment.encode('utf-8')
-
-    if generate_uuid:
-        nodeuuid = node.uuid
-    b_nodeuuid = nodeuuid.encode('utf-8')
-
-    b_nodevalidate = nodevalidate.encode('utf-8')
-
-    b_fname = out_file.encode('utf-8')
-
-    createBinaryCnode(b_fname, b_nodename, b_nodetype, b_nodeuuid, b_nodedescription, b_nodedatatype, b_nodemin, b_nodemax, b_nodeunit, b_nodeallowed, b_nodedefault, b_nodevalidate, children)
-
-    for child in node.children:
-        export_node(child, generate_uuid, out_file)
+    nodedatatype = b""
+    if node.type in _DATATYPE_BEARING:
+        nodedatatype = node.data_type.b_value
+
+    # in case of unit, the attribute will be missing
+    unit = getattr(node, 'unit', None)
+
+    return (
+        str(node.name).encode('utf-8'),
+        node.type.b_value,
+        node.uuid.encode('utf-8') if generate_uuid else b"",
+        node.description.encode('utf-8'),
+        nodedatatype,
+        str(node.min).encode('utf-8') if node.min != "" else b"",
+        str(node.max).encode('utf-8') if node.max != "" else b"",
+        unit.b_value if unit is not None else b"",
+        allowedString(node.allowed) if node.allowed != "" else b"",
+        str(node.default_value).encode('utf-8') if node.default_value != "" else b"",
+        b"",  # validate
+        len(node.children),
+    )
+
+
+def collect_records(root, generate_uuid):
+    """Returns the records of all nodes below and including root in depth-first pre-order"""
+    records = []
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        records.append(node_record(node, generate_uuid))
+        stack.extend(reversed(node.children))
+    return records
+
+
+def export_node(node, generate_uuid, b_out_file):
+    records = collect_records(node, generate_uuid)
+    createBinaryCnodeBatch(b_out_file, records)
 
 
 def export(config: argparse.Namespace, root: VSSNode):
-    global _cbinary
-    dllName = "../binary/binarytool.so"
-    dllAbsPath = os.path.dirname(os.path.abspath(__file__)) + os.path.sep + dllName
-    _cbinary = ctypes.CDLL(dllAbsPath)
-
-    #void createBinaryCnode(char* fname, char* name, char* type, char* uuid, char* descr, char* datatype, char* min, char* max, char* unit, char* allowed, char* defaultAllowed, char* validate, int children);
-    _cbinary.createBinaryCnode.argtypes = (ctypes.c_char_p,ctypes.c_char_p,ctypes.c_char_p,ctypes.c_char_p,ctypes.c_char_p,ctypes.c_char_p,ctypes.c_char_p,ctypes.c_char_p,ctypes.c_char_p,ctypes.c_char_p,ctypes.c_char_p,ctypes.c_char_p,ctypes.c_int)
-    
+    if _cbinary is None:
+        print("Could not load " + _dllAbsPath + ". Build it with: gcc -shared -o binarytool.so -fPIC binarytool.c")
+        sys.exit(-1)
+
     print("Generating binary output...")
     out_file = config.output_file
-    export_node(root, not config.no_uuid, out_file)
+    export_node(root, not config.no_uuid, os.fsencode(out_file))
     print("Binary output generated in " + out_file)
 
 